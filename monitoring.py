@@ -6,17 +6,194 @@ Comprehensive automation tasks for Linux systems using Python
 
 import os
 import sys
+import atexit
+import weakref
 import subprocess
 import time
 import shutil
 from datetime import datetime
-import json
+from contextlib import suppress
 import re
 import pwd
 import grp
 import stat
 import socket
+import errno
+import struct
+import fcntl
 import platform
+import functools
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+  import orjson
+
+  def _json_dumps(obj):
+    """Serialize obj to indented JSON bytes"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+
+except ImportError:
+  import json
+
+  def _json_dumps(obj):
+    """Serialize obj to indented JSON bytes"""
+    return json.dumps(obj, indent=2, default=str).encode()
+
+_MEMTOTAL_RE = re.compile(r'^MemTotal:\s+(\d+)', re.M)
+_MEMAVAILABLE_RE = re.compile(r'^MemAvailable:\s+(\d+)', re.M)
+_IFACE_RE = re.compile(r'^\d+:')
+_INET_RE = re.compile(r'inet (\S+)')
+_LOGIN_SHELLS = frozenset(
+    ('/bin/bash', '/bin/sh', '/bin/zsh', '/bin/fish', '/usr/bin/bash'))
+_OLD_LOG_SUFFIXES = ('.log', '.old', '.1', '.2', '.3')
+_SIOCGIFADDR = 0x8915
+_SIOCGIFNETMASK = 0x891b
+_IP_RE = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+
+# Common failed login patterns, matched against lower-cased log data.
+# Lowering once beats a re.I alternation, which re evaluates byte by byte.
+_FAIL_PATTERNS = (b'failed password', b'authentication failure',
+                  b'invalid user', b'failed login', b'login incorrect')
+_FAIL_RE = re.compile(b'|'.join(map(re.escape, _FAIL_PATTERNS)))
+# Log files are scanned in chunks of about this size to bound memory use
+_SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _scan_files(path):
+  """Recursively yield DirEntry objects for regular files under path"""
+  try:
+    with os.scandir(path) as it:
+      for entry in it:
+        try:
+          if entry.is_dir(follow_symlinks=False):
+            yield from _scan_files(entry.path)
+          elif entry.is_file(follow_symlinks=False):
+            yield entry
+        except OSError:
+          pass
+  except OSError:
+    # Unreadable directories are skipped, as os.walk() does
+    pass
+
+
+def _iter_failed_lines(f):
+  """Yield raw lines of a binary log file that match _FAIL_RE"""
+  tail = b''
+  while True:
+    chunk = f.read(_SCAN_CHUNK_SIZE)
+    data = tail + chunk if tail else chunk
+    if chunk:
+      # Only scan whole lines; the partial last line carries over
+      end = data.rfind(b'\n') + 1
+    else:
+      end = len(data)
+    tail = data[end:]
+
+    # Lower-case once and search for the bare patterns; wrapping them in
+    # ^.*...$ or using re.I makes `re` backtrack at every byte. Each hit is
+    # then widened to its line.
+    lowered = data.lower()
+    line_end = -1
+    for match in _FAIL_RE.finditer(lowered, 0, end):
+      pos = match.start()
+      if pos < line_end:
+        # Another pattern on a line already yielded
+        continue
+      line_start = lowered.rfind(b'\n', 0, pos) + 1
+      line_end = lowered.find(b'\n', pos, end)
+      if line_end == -1:
+        line_end = end
+      yield data[line_start:line_end]
+
+    if not chunk:
+      return
+
+
+def _ipv4_address(sock, if_name):
+  """Return the primary IPv4 address of an interface as 'addr/prefix'
+
+  SIOCGIFADDR only reports the primary address; secondary IPv4 addresses
+  on the same interface are not returned.
+  """
+  ifreq = struct.pack('256s', if_name[:15].encode())
+  try:
+    addr = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, ifreq)[20:24]
+    mask = fcntl.ioctl(sock.fileno(), _SIOCGIFNETMASK, ifreq)[20:24]
+  except OSError as e:
+    if e.errno == errno.EADDRNOTAVAIL:
+      # Interface has no IPv4 address
+      return None
+    # Unsupported or blocked ioctl; let the caller fall back to `ip`
+    raise
+  prefix = bin(int.from_bytes(mask, 'big')).count('1')
+  return f"{socket.inet_ntoa(addr)}/{prefix}"
+
+
+@functools.lru_cache(maxsize=None)
+def _user_name(uid):
+  """Resolve a uid to a user name, caching NSS lookups"""
+  return pwd.getpwuid(uid).pw_name
+
+
+@functools.lru_cache(maxsize=None)
+def _group_name(gid):
+  """Resolve a gid to a group name, caching NSS lookups"""
+  return grp.getgrgid(gid).gr_name
+
+
+@functools.lru_cache(maxsize=None)
+def _linux_distribution():
+  """Read the distribution name once; it cannot change while running"""
+  try:
+    # Try to read /etc/os-release
+    if os.path.exists('/etc/os-release'):
+      with open('/etc/os-release', 'r') as f:
+        info = {}
+        for line in f:
+          if '=' in line:
+            key, value = line.strip().split('=', 1)
+            # Values may be double- or single-quoted
+            info[key] = value.strip('"\'')
+      return info.get('PRETTY_NAME', 'Unknown Linux')
+
+    # Fallback to platform module
+    return platform.platform()
+  except OSError:
+    return "Unknown Linux Distribution"
+
+
+def _close_log_at_exit(ref):
+  """atexit hook that closes an instance's log if it is still alive"""
+  automation = ref()
+  if automation is not None:
+    automation.close_log()
+
+
+def _flushes_log(method):
+  """Flush buffered log lines when the wrapped method returns"""
+
+  if inspect.iscoroutinefunction(method):
+
+    @functools.wraps(method)
+    async def async_wrapper(self, *args, **kwargs):
+      try:
+        return await method(self, *args, **kwargs)
+      finally:
+        self._flush_log()
+
+    return async_wrapper
+
+  @functools.wraps(method)
+  def wrapper(self, *args, **kwargs):
+    try:
+      return method(self, *args, **kwargs)
+    finally:
+      self._flush_log()
+
+  return wrapper
 
 
 class LinuxAutomation:
@@ -31,33 +208,93 @@ class LinuxAutomation:
         self.log_file)) if os.path.dirname(self.log_file) else "."
     os.makedirs(log_dir, exist_ok=True)
 
+    # Keep the log open for the lifetime of the instance; lines are
+    # buffered in memory and written to the file and stdout in one batch
+    # by _flush_log()
+    # Each thread buffers its own lines so concurrent collectors (see
+    # generate_system_report) write contiguous blocks to the log; every
+    # buffer is also registered in _buffers so close_log() can flush lines
+    # logged from any thread
+    self._log_fh = open(self.log_file, "a")
+    self._log_lock = threading.Lock()
+    self._local = threading.local()
+    self._buffers = []
+    self._last_ts = (0, '')
+    # Only a weak reference is held so instances can still be collected
+    self._atexit_hook = functools.partial(_close_log_at_exit,
+                                          weakref.ref(self))
+    atexit.register(self._atexit_hook)
+
+  @property
+  def _pending(self):
+    """Log lines buffered by the current thread"""
+    pending = getattr(self._local, 'pending', None)
+    if pending is None:
+      pending = self._local.pending = []
+      thread = threading.current_thread()
+      with self._log_lock:
+        # Drop drained buffers of threads that have exited
+        self._buffers = [(t, b) for t, b in self._buffers if b or t.is_alive()]
+        self._buffers.append((thread, pending))
+    return pending
+
+  def close_log(self):
+    """Flush pending log lines from all threads and close the log"""
+    self._flush_log(all_threads=True)
+    if not self._log_fh.closed:
+      self._log_fh.close()
+    atexit.unregister(self._atexit_hook)
+
+  def _flush_log(self, all_threads=False):
+    """Write buffered log lines to the log file and stdout in one block"""
+    pending = self._pending
+    with self._log_lock:
+      buffers = [b for _, b in self._buffers] if all_threads else [pending]
+      # Other threads may append while we write, so only take (and later
+      # drop) the lines present now
+      counts = [len(buffer) for buffer in buffers]
+      lines = [
+          line for buffer, n in zip(buffers, counts) for line in buffer[:n]
+      ]
+      if not lines:
+        return
+      if self._log_fh.closed:
+        # Logged after close_log(); append without keeping a handle open
+        with open(self.log_file, "a") as f:
+          f.writelines(lines)
+      else:
+        self._log_fh.writelines(lines)
+        self._log_fh.flush()
+      for buffer, n in zip(buffers, counts):
+        del buffer[:n]
+      # Echo under the same lock so concurrent sections stay contiguous on
+      # the console too
+      sys.stdout.writelines(lines)
+      sys.stdout.flush()
+
+  def __del__(self):
+    try:
+      self.close_log()
+    except Exception:
+      pass
+
   def log_message(self, message):
     """Log messages with timestamp"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {message}"
-    print(log_entry)
-    with open(self.log_file, "a") as f:
-      f.write(log_entry + "\n")
+    # Timestamps have one-second resolution, so format each second once.
+    # The (second, string) pair is swapped as one tuple to stay consistent
+    # across collector threads.
+    now = int(time.time())
+    last_sec, timestamp = self._last_ts
+    if now != last_sec:
+      timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+      self._last_ts = (now, timestamp)
+    self._pending.append(f"[{timestamp}] {message}\n")
 
   def get_linux_distribution(self):
     """Get Linux distribution information"""
-    try:
-      # Try to read /etc/os-release
-      if os.path.exists('/etc/os-release'):
-        with open('/etc/os-release', 'r') as f:
-          lines = f.readlines()
-          info = {}
-          for line in lines:
-            if '=' in line:
-              key, value = line.strip().split('=', 1)
-              info[key] = value.strip('"')
-          return info.get('PRETTY_NAME', 'Unknown Linux')
-
-      # Fallback to platform module
-      return platform.platform()
-    except:
-      return "Unknown Linux Distribution"
+    return _linux_distribution()
 
+  @_flushes_log
   def system_info(self):
     """Gather comprehensive system information"""
     self.log_message("=== System Information ===")
@@ -65,44 +302,35 @@ class LinuxAutomation:
     # Get serial number from DMI
     serial_number = "Unknown"
     try:
-      result = subprocess.run(['cat', '/sys/class/dmi/id/product_serial'],
-                              capture_output=True,
-                              text=True)
-      if result.returncode == 0:
-        serial_number = result.stdout.strip()
-    except:
-      try:
+      with open('/sys/class/dmi/id/product_serial', 'r') as f:
+        serial_number = f.read().strip()
+    except OSError:
+      with suppress(OSError):
         result = subprocess.run(['dmidecode', '-s', 'system-serial-number'],
                                 capture_output=True,
                                 text=True)
         if result.returncode == 0:
           serial_number = result.stdout.strip()
-      except:
-        pass
 
     # Get full hostname with domain
     full_hostname = "Unknown"
     try:
       full_hostname = socket.getfqdn()
-    except:
+    except OSError:
       full_hostname = os.uname().nodename
 
     # Get system uptime
     uptime = "Unknown"
-    try:
+    with suppress(OSError, ValueError, IndexError):
       with open('/proc/uptime', 'r') as f:
         uptime_seconds = float(f.readline().split()[0])
         uptime = f"{uptime_seconds / 3600:.2f} hours"
-    except:
-      pass
 
     # Get load average
     load_avg = "Unknown"
-    try:
+    with suppress(OSError):
       load_avg = os.getloadavg()
       load_avg = f"1min: {load_avg[0]:.2f}, 5min: {load_avg[1]:.2f}, 15min: {load_avg[2]:.2f}"
-    except:
-      pass
 
     # Get system info
     info = {
@@ -126,6 +354,7 @@ class LinuxAutomation:
 
     return info
 
+  @_flushes_log
   def check_services(self, services=None):
     """Check status of system services"""
     if services is None:
@@ -134,20 +363,38 @@ class LinuxAutomation:
     self.log_message("=== Service Status Check ===")
 
     service_status = {}
-    for service in services:
-      try:
-        result = subprocess.run(['systemctl', 'is-active', service],
-                                capture_output=True,
-                                text=True)
-        status = result.stdout.strip()
-        service_status[service] = status
-        self.log_message(f"Service {service}: {status}")
-      except Exception as e:
+    if not services:
+      return service_status
+
+    # systemctl prints one status line per unit, in argument order
+    try:
+      result = subprocess.run(['systemctl', 'is-active', '--', *services],
+                              capture_output=True,
+                              text=True)
+      statuses = result.stdout.split()
+    except Exception as e:
+      for service in services:
         service_status[service] = f"Error: {e}"
         self.log_message(f"Service {service}: Error checking - {e}")
+      return service_status
+
+    if len(statuses) != len(services):
+      # The batch failed as a whole (no systemd, invalid unit name, ...);
+      # report the error rather than guessing per-unit states
+      error = ('; '.join(result.stderr.strip().splitlines()) or
+               f"exit code {result.returncode}")
+      for service in services:
+        service_status[service] = f"Error: {error}"
+        self.log_message(f"Service {service}: Error checking - {error}")
+      return service_status
+
+    for service, status in zip(services, statuses):
+      service_status[service] = status
+      self.log_message(f"Service {service}: {status}")
 
     return service_status
 
+  @_flushes_log
   def disk_usage_check(self, paths=None):
     """Check disk usage for multiple paths"""
     if paths is None:
@@ -156,48 +403,53 @@ class LinuxAutomation:
     self.log_message("=== Disk Usage Check ===")
 
     disk_info = {}
+    # Paths on the same filesystem share one statvfs() result
+    usage_by_device = {}
     for path in paths:
-      if os.path.exists(path):
-        try:
-          total, used, free = shutil.disk_usage(path)
-
-          # Convert to GB
-          total_gb = total // (1024**3)
-          used_gb = used // (1024**3)
-          free_gb = free // (1024**3)
-          usage_percent = (used / total) * 100
-
-          disk_info[path] = {
-              'total_gb': total_gb,
-              'used_gb': used_gb,
-              'free_gb': free_gb,
-              'usage_percent': usage_percent
-          }
+      try:
+        device = os.stat(path).st_dev
+        if device not in usage_by_device:
+          usage_by_device[device] = shutil.disk_usage(path)
+        total, used, free = usage_by_device[device]
+
+        # Convert to GB
+        total_gb = total // (1024**3)
+        used_gb = used // (1024**3)
+        free_gb = free // (1024**3)
+        usage_percent = (used / total) * 100
+
+        disk_info[path] = {
+            'total_gb': total_gb,
+            'used_gb': used_gb,
+            'free_gb': free_gb,
+            'usage_percent': usage_percent
+        }
 
-          self.log_message(f"{path}: {total_gb}GB total, {used_gb}GB used, "
-                           f"{free_gb}GB free ({usage_percent:.1f}%)")
+        self.log_message(f"{path}: {total_gb}GB total, {used_gb}GB used, "
+                         f"{free_gb}GB free ({usage_percent:.1f}%)")
 
-          if usage_percent > 80:
-            self.log_message(f"WARNING: {path} usage is above 80%!")
+        if usage_percent > 80:
+          self.log_message(f"WARNING: {path} usage is above 80%!")
 
-        except Exception as e:
-          self.log_message(f"Error checking disk usage for {path}: {e}")
+      except FileNotFoundError:
+        # Missing paths are skipped, as before
+        continue
+      except Exception as e:
+        self.log_message(f"Error checking disk usage for {path}: {e}")
 
     return disk_info
 
+  @_flushes_log
   def memory_check(self):
     """Check memory usage"""
     self.log_message("=== Memory Usage Check ===")
 
     try:
       with open('/proc/meminfo', 'r') as f:
-        meminfo = {}
-        for line in f:
-          key, value = line.split(':', 1)
-          meminfo[key.strip()] = value.strip()
+        data = f.read()
 
-      total_kb = int(meminfo['MemTotal'].split()[0])
-      available_kb = int(meminfo['MemAvailable'].split()[0])
+      total_kb = int(_MEMTOTAL_RE.search(data).group(1))
+      available_kb = int(_MEMAVAILABLE_RE.search(data).group(1))
       used_kb = total_kb - available_kb
 
       total_gb = total_kb / (1024 * 1024)
@@ -223,6 +475,7 @@ class LinuxAutomation:
       self.log_message(f"Error checking memory: {e}")
       return None
 
+  @_flushes_log
   def process_monitor(self, process_names=None):
     """Monitor multiple processes"""
     if process_names is None:
@@ -231,40 +484,72 @@ class LinuxAutomation:
     self.log_message("=== Process Monitoring ===")
 
     process_info = {}
-    for process_name in process_names:
-      try:
-        result = subprocess.run(['pgrep', '-f', process_name],
-                                capture_output=True,
-                                text=True)
-
-        if result.returncode == 0:
-          pids = result.stdout.strip().split('\n')
-          process_info[process_name] = {
-              'running': True,
-              'pids': pids,
-              'count': len(pids)
-          }
-          self.log_message(
-              f"Process '{process_name}': Running ({len(pids)} instances) - PIDs: {', '.join(pids)}"
-          )
-        else:
-          process_info[process_name] = {
-              'running': False,
-              'pids': [],
-              'count': 0
-          }
-          self.log_message(f"Process '{process_name}': Not running")
-
-      except Exception as e:
-        self.log_message(f"Error monitoring process '{process_name}': {e}")
+    matches = {name: [] for name in process_names}
+    try:
+      # One pass over /proc instead of a pgrep process per name
+      patterns = [(name, name.encode()) for name in process_names]
+      with os.scandir('/proc') as it:
+        pids = sorted((e.name for e in it if e.name.isdigit()), key=int)
+      for pid in pids:
+        try:
+          with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            cmdline = f.read().rstrip(b'\0').replace(b'\0', b' ')
+        except OSError:
+          # Process exited or is not accessible
+          continue
+        for name, pattern in patterns:
+          if pattern in cmdline:
+            matches[name].append(pid)
+    except Exception as e:
+      self.log_message(f"Error monitoring processes: {e}")
+      return process_info
+
+    for process_name, pids in matches.items():
+      if pids:
+        process_info[process_name] = {
+            'running': True,
+            'pids': pids,
+            'count': len(pids)
+        }
+        self.log_message(
+            f"Process '{process_name}': Running ({len(pids)} instances) - PIDs: {', '.join(pids)}"
+        )
+      else:
+        process_info[process_name] = {
+            'running': False,
+            'pids': [],
+            'count': 0
+        }
+        self.log_message(f"Process '{process_name}': Not running")
 
     return process_info
 
+  @_flushes_log
   def network_interfaces(self):
     """Get network interface information"""
     self.log_message("=== Network Interfaces ===")
 
     interfaces = {}
+    try:
+      # Ask the kernel directly instead of parsing `ip addr show`. This
+      # reports only the primary IPv4 address of each interface (the `ip`
+      # fallback below lists secondary addresses too). Collect everything
+      # first so a failure part-way leaves nothing logged.
+      with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _, if_name in socket.if_nameindex():
+          address = _ipv4_address(sock, if_name)
+          interfaces[if_name] = {'addresses': [address] if address else []}
+    except OSError as e:
+      self.log_message(f"Interface query failed ({e}), falling back to 'ip'")
+      interfaces = {}
+    else:
+      for if_name, info in interfaces.items():
+        self.log_message(f"Interface: {if_name}")
+        for address in info['addresses']:
+          self.log_message(f"  IPv4: {address}")
+      return interfaces
+
+    # Fallback for systems without SIOCGIFADDR support
     try:
       result = subprocess.run(['ip', 'addr', 'show'],
                               capture_output=True,
@@ -273,7 +558,7 @@ class LinuxAutomation:
       if result.returncode == 0:
         current_interface = None
         for line in result.stdout.split('\n'):
-          if re.match(r'^\d+:', line):
+          if _IFACE_RE.match(line):
             # New interface
             parts = line.split()
             if_name = parts[1].rstrip(':')
@@ -282,7 +567,7 @@ class LinuxAutomation:
             self.log_message(f"Interface: {if_name}")
           elif 'inet ' in line and current_interface:
             # IPv4 address
-            ip_match = re.search(r'inet (\S+)', line)
+            ip_match = _INET_RE.search(line)
             if ip_match:
               interfaces[current_interface]['addresses'].append(
                   ip_match.group(1))
@@ -293,6 +578,7 @@ class LinuxAutomation:
 
     return interfaces
 
+  @_flushes_log
   def check_failed_logins(self, days=7):
     """Check for failed login attempts in the last N days"""
     self.log_message(f"=== Checking failed logins in last {days} days ===")
@@ -304,28 +590,25 @@ class LinuxAutomation:
     ]
 
     failed_attempts = []
+    # One timestamp for the whole scan rather than one per matched line
+    scan_time = datetime.now()
+    scan_ts = scan_time.strftime("%Y-%m-%d %H:%M:%S")
 
     for log_file in log_files:
       try:
         if os.path.exists(log_file) and os.access(log_file, os.R_OK):
           self.log_message(f"Checking {log_file}")
 
-          with open(log_file, 'r') as f:
-            for line in f:
-              # Look for common failed login patterns
-              if any(pattern in line.lower() for pattern in [
-                  'failed password', 'authentication failure', 'invalid user',
-                  'failed login', 'login incorrect',
-                  'pam_unix(sshd:auth): authentication failure'
-              ]):
-                failed_attempts.append({
-                    'log_file':
-                    log_file,
-                    'entry':
-                    line.strip(),
-                    'timestamp':
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
+          with open(log_file, 'rb') as f:
+            for line in _iter_failed_lines(f):
+              failed_attempts.append({
+                  'log_file':
+                  log_file,
+                  'entry':
+                  line.strip().decode('utf-8', 'replace'),
+                  'timestamp':
+                  scan_ts
+              })
 
       except PermissionError:
         self.log_message(f"Permission denied accessing {log_file}")
@@ -347,7 +630,7 @@ class LinuxAutomation:
                 'entry':
                 line.strip(),
                 'timestamp':
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                scan_ts
             })
             self.log_message(f"Failed login: {line.strip()}")
     except Exception as e:
@@ -359,16 +642,16 @@ class LinuxAutomation:
           f"ALERT: Found {len(failed_attempts)} failed login attempts")
 
       # Save detailed report
-      report_file = f"failed_logins_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-      with open(report_file, 'w') as f:
-        json.dump(failed_attempts, f, indent=2)
+      report_file = f"failed_logins_{scan_time.strftime('%Y%m%d_%H%M%S')}.json"
+      with open(report_file, 'wb') as f:
+        f.write(_json_dumps(failed_attempts))
       self.log_message(f"Detailed report saved to: {report_file}")
 
       # Count unique IPs if possible
       unique_sources = set()
       for attempt in failed_attempts:
         entry = attempt['entry']
-        ip_match = re.search(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b', entry)
+        ip_match = _IP_RE.search(entry)
         if ip_match:
           unique_sources.add(ip_match.group())
 
@@ -381,38 +664,44 @@ class LinuxAutomation:
 
     return failed_attempts
 
+  @_flushes_log
   def list_users(self):
     """List system users and their information"""
     self.log_message("=== System Users ===")
 
     users_info = []
     try:
-      # Read /etc/passwd to get user information
-      with open('/etc/passwd', 'r') as f:
-        for line in f:
-          if line.strip():
-            parts = line.strip().split(':')
-            if len(parts) >= 7:
-              user_info = {
-                  'username': parts[0],
-                  'uid': int(parts[2]),
-                  'gid': int(parts[3]),
-                  'description': parts[4],
-                  'home_dir': parts[5],
-                  'shell': parts[6]
-              }
-              
-              # Check if user has login shell
-              login_shells = ['/bin/bash', '/bin/sh', '/bin/zsh', '/bin/fish', '/usr/bin/bash']
-              user_info['can_login'] = user_info['shell'] in login_shells
-              
-              # Check if home directory exists
-              user_info['home_exists'] = os.path.exists(user_info['home_dir'])
-              
-              users_info.append(user_info)
-              
-              self.log_message(f"User: {user_info['username']} (UID: {user_info['uid']}, "
-                             f"Shell: {user_info['shell']}, Home: {user_info['home_dir']})")
+      # Directories under /home, listed once instead of a stat per user.
+      # is_dir() follows symlinks, so dangling links are left out and fall
+      # through to os.path.exists() below.
+      try:
+        with os.scandir('/home') as it:
+          home_entries = {entry.path for entry in it if entry.is_dir()}
+      except OSError:
+        home_entries = set()
+
+      # Walk the password database in one C-level pass
+      for entry in pwd.getpwall():
+        user_info = {
+            'username': entry.pw_name,
+            'uid': entry.pw_uid,
+            'gid': entry.pw_gid,
+            'description': entry.pw_gecos,
+            'home_dir': entry.pw_dir,
+            'shell': entry.pw_shell
+        }
+
+        # Check if user has login shell
+        user_info['can_login'] = user_info['shell'] in _LOGIN_SHELLS
+
+        # Check if home directory exists
+        user_info['home_exists'] = (user_info['home_dir'] in home_entries or
+                                    os.path.exists(user_info['home_dir']))
+
+        users_info.append(user_info)
+
+        self.log_message(f"User: {user_info['username']} (UID: {user_info['uid']}, "
+                         f"Shell: {user_info['shell']}, Home: {user_info['home_dir']})")
 
       # Count different types of users
       regular_users = [u for u in users_info if u['uid'] >= 1000 and u['can_login']]
@@ -435,6 +724,7 @@ class LinuxAutomation:
 
     return users_info
 
+  @_flushes_log
   def check_file_permissions(self, critical_files=None):
     """Check permissions on critical system files"""
     if critical_files is None:
@@ -451,8 +741,8 @@ class LinuxAutomation:
         if os.path.exists(file_path):
           file_stat = os.stat(file_path)
           mode = stat.filemode(file_stat.st_mode)
-          owner = pwd.getpwuid(file_stat.st_uid).pw_name
-          group = grp.getgrgid(file_stat.st_gid).gr_name
+          owner = _user_name(file_stat.st_uid)
+          group = _group_name(file_stat.st_gid)
 
           self.log_message(f"{file_path}: {mode} {owner}:{group}")
 
@@ -475,6 +765,7 @@ class LinuxAutomation:
 
     return permission_issues
 
+  @_flushes_log
   def system_cleanup(self):
     """Perform system cleanup tasks"""
     self.log_message("=== System Cleanup ===")
@@ -482,41 +773,34 @@ class LinuxAutomation:
     cleanup_tasks = {'old_logs': 0, 'temp_files': 0, 'package_cache': 0}
 
     # Clean old log files (older than 30 days)
+    now = time.time()
+    log_cutoff = now - 30 * 24 * 3600
     log_dirs = ['/var/log', '/tmp']
     for log_dir in log_dirs:
       if os.path.exists(log_dir):
         try:
-          for root, dirs, files in os.walk(log_dir):
-            for file in files:
-              if file.endswith(('.log', '.old', '.1', '.2', '.3')):
-                file_path = os.path.join(root, file)
-                try:
-                  file_stat = os.stat(file_path)
-                  file_age = time.time() - file_stat.st_mtime
-                  if file_age > 30 * 24 * 3600:  # 30 days
-                    # Don't actually delete, just count
-                    cleanup_tasks['old_logs'] += 1
-                    self.log_message(f"Old log file found: {file_path}")
-                except:
-                  pass
+          for entry in _scan_files(log_dir):
+            if entry.name.endswith(_OLD_LOG_SUFFIXES):
+              with suppress(OSError):
+                if entry.stat(follow_symlinks=False).st_mtime < log_cutoff:
+                  # Don't actually delete, just count
+                  cleanup_tasks['old_logs'] += 1
+                  self.log_message(f"Old log file found: {entry.path}")
         except Exception as e:
           self.log_message(f"Error checking {log_dir}: {e}")
 
-    # Count temporary files
+    # Count temporary files (older than 7 days)
+    temp_cutoff = now - 7 * 24 * 3600
     temp_dirs = ['/tmp', '/var/tmp']
     for temp_dir in temp_dirs:
       if os.path.exists(temp_dir):
         try:
-          for item in os.listdir(temp_dir):
-            item_path = os.path.join(temp_dir, item)
-            if os.path.isfile(item_path):
-              try:
-                file_stat = os.stat(item_path)
-                file_age = time.time() - file_stat.st_mtime
-                if file_age > 7 * 24 * 3600:  # 7 days
-                  cleanup_tasks['temp_files'] += 1
-              except:
-                pass
+          with os.scandir(temp_dir) as it:
+            for entry in it:
+              if entry.is_file(follow_symlinks=False):
+                with suppress(OSError):
+                  if entry.stat(follow_symlinks=False).st_mtime < temp_cutoff:
+                    cleanup_tasks['temp_files'] += 1
         except Exception as e:
           self.log_message(f"Error checking {temp_dir}: {e}")
 
@@ -526,30 +810,51 @@ class LinuxAutomation:
 
     return cleanup_tasks
 
+  @_flushes_log
   def generate_system_report(self):
         """Generate comprehensive system report"""
         self.log_message("=== Generating System Report ===")
+        self._flush_log()
+        report_time = datetime.now()
+
+        # The collectors are independent and mostly wait on I/O or child
+        # processes, so run them concurrently
+        tasks = {
+            'system_info': self.system_info,
+            'disk_usage': self.disk_usage_check,
+            'memory_usage': self.memory_check,
+            'network_interfaces': self.network_interfaces,
+            'process_status': self.process_monitor,
+            'service_status': self.check_services,
+            'users': self.list_users,
+            'failed_logins': self.check_failed_logins,
+            'permission_issues': self.check_file_permissions,
+            'cleanup_recommendations': self.system_cleanup
+        }
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {name: executor.submit(fn) for name, fn in tasks.items()}
+            results = {name: future.result() for name, future in futures.items()}
 
         report = {
-            'timestamp': datetime.now().isoformat(),
-            'system_info': self.system_info(),
-            'disk_usage': self.disk_usage_check(),
-            'memory_usage': self.memory_check(),
-            'network_interfaces': self.network_interfaces(),
-            'process_status': self.process_monitor(),
-            'service_status': self.check_services(),
-            'users': self.list_users(),
+            'timestamp': report_time.isoformat(),
+            'system_info': results['system_info'],
+            'disk_usage': results['disk_usage'],
+            'memory_usage': results['memory_usage'],
+            'network_interfaces': results['network_interfaces'],
+            'process_status': results['process_status'],
+            'service_status': results['service_status'],
+            'users': results['users'],
             'security_check': {
-                'failed_logins': len(self.check_failed_logins()),
-                'permission_issues': self.check_file_permissions()
+                'failed_logins': len(results['failed_logins']),
+                'permission_issues': results['permission_issues']
             },
-            'cleanup_recommendations': self.system_cleanup()
+            'cleanup_recommendations': results['cleanup_recommendations']
         }
 
         # Save JSON report to file
-        report_file = f"system_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        report_file = f"system_report_{report_time.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(report_file, 'wb') as f:
+            f.write(_json_dumps(report))
 
         self.log_message(f"System report saved to: {report_file}")
 
@@ -558,147 +863,153 @@ class LinuxAutomation:
 
         return report
 
+  @_flushes_log
   def save_monitoring_report(self, report):
         """Save monitoring report to report_monitoring.txt"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        with open("report_monitoring.txt", "w") as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"SYSTEM MONITORING REPORT - {timestamp}\n")
-            f.write("=" * 80 + "\n\n")
-
-            # System Information
-            f.write("SYSTEM INFORMATION:\n")
-            f.write("-" * 40 + "\n")
-            sys_info = report['system_info']
-            f.write(f"Hostname: {sys_info['hostname']}\n")
-            f.write(f"Full Hostname: {sys_info['full_hostname']}\n")
-            f.write(f"Serial Number: {sys_info['serial_number']}\n")
-            f.write(f"Distribution: {sys_info['distribution']}\n")
-            f.write(f"Kernel: {sys_info['kernel']}\n")
-            f.write(f"Architecture: {sys_info['architecture']}\n")
-            f.write(f"Current User: {sys_info['current_user']}\n")
-            f.write(f"Python Version: {sys_info['python_version']}\n")
-            f.write(f"System Uptime: {sys_info['system_uptime']}\n")
-            f.write(f"Load Average: {sys_info['load_average']}\n\n")
-
-            # Memory Usage
-            f.write("MEMORY USAGE:\n")
-            f.write("-" * 40 + "\n")
-            mem = report['memory_usage']
-            if mem:
-                f.write(f"Total: {mem['total_gb']:.2f} GB\n")
-                f.write(f"Used: {mem['used_gb']:.2f} GB\n")
-                f.write(f"Available: {mem['available_gb']:.2f} GB\n")
-                f.write(f"Usage: {mem['usage_percent']:.1f}%\n")
-                if mem['usage_percent'] > 85:
-                    f.write("âš ï¸  WARNING: High memory usage!\n")
-            f.write("\n")
-
-            # Disk Usage
-            f.write("DISK USAGE:\n")
-            f.write("-" * 40 + "\n")
-            for path, disk_info in report['disk_usage'].items():
-                f.write(f"{path}:\n")
-                f.write(f"  Total: {disk_info['total_gb']} GB\n")
-                f.write(f"  Used: {disk_info['used_gb']} GB\n")
-                f.write(f"  Free: {disk_info['free_gb']} GB\n")
-                f.write(f"  Usage: {disk_info['usage_percent']:.1f}%\n")
-                if disk_info['usage_percent'] > 80:
-                    f.write("  âš ï¸  WARNING: High disk usage!\n")
-                f.write("\n")
-
-            # Process Status
-            f.write("PROCESS STATUS:\n")
-            f.write("-" * 40 + "\n")
-            for process, status in report['process_status'].items():
-                f.write(f"{process}: ")
-                if status['running']:
-                    f.write(f"Running ({status['count']} instances) - PIDs: {', '.join(status['pids'])}\n")
-                else:
-                    f.write("Not running\n")
-            f.write("\n")
-
-            # Service Status
-            f.write("SERVICE STATUS:\n")
-            f.write("-" * 40 + "\n")
-            for service, status in report['service_status'].items():
-                f.write(f"{service}: {status}\n")
-            f.write("\n")
-
-            # Users
-            f.write("SYSTEM USERS:\n")
-            f.write("-" * 40 + "\n")
-            users = report['users']
-            if users:
-                regular_users = [u for u in users if u['uid'] >= 1000 and u['can_login']]
-                system_users = [u for u in users if u['uid'] < 1000]
-                service_users = [u for u in users if u['uid'] >= 1000 and not u['can_login']]
-
-                f.write(f"Total users: {len(users)}\n")
-                f.write(f"Regular users: {len(regular_users)}\n")
-                f.write(f"System users: {len(system_users)}\n")
-                f.write(f"Service users: {len(service_users)}\n\n")
-
-                if regular_users:
-                    f.write("Regular users with login access:\n")
-                    for user in regular_users:
-                        f.write(f"  {user['username']} (UID: {user['uid']}, Home: {user['home_dir']})\n")
-                        f.write(f"    Shell: {user['shell']}, Home exists: {user['home_exists']}\n")
-                    f.write("\n")
-
-                if service_users:
-                    f.write("Service users (no login):\n")
-                    for user in service_users[:10]:  # Show first 10 service users
-                        f.write(f"  {user['username']} (UID: {user['uid']}, Shell: {user['shell']})\n")
-                    if len(service_users) > 10:
-                        f.write(f"  ... and {len(service_users) - 10} more service users\n")
-                    f.write("\n")
-            else:
-                f.write("No user information available\n\n")
-
-            # Security Check
-            f.write("SECURITY CHECK:\n")
-            f.write("-" * 40 + "\n")
-            security = report['security_check']
-            f.write(f"Failed login attempts: {security['failed_logins']}\n")
-
-            if security['permission_issues']:
-                f.write("âš ï¸  SECURITY WARNINGS:\n")
-                for issue in security['permission_issues']:
-                    f.write(f"  - {issue}\n")
-            else:
-                f.write("âœ… No permission issues found\n")
-            f.write("\n")
-
-            # Cleanup Recommendations
-            f.write("CLEANUP RECOMMENDATIONS:\n")
-            f.write("-" * 40 + "\n")
-            cleanup = report['cleanup_recommendations']
-            f.write(f"Old log files: {cleanup['old_logs']}\n")
-            f.write(f"Old temp files: {cleanup['temp_files']}\n")
-            f.write(f"Package cache: {cleanup['package_cache']}\n")
-            f.write("\n")
-
-            # Network Interfaces
-            f.write("NETWORK INTERFACES:\n")
-            f.write("-" * 40 + "\n")
-            networks = report['network_interfaces']
-            if networks:
-                for interface, info in networks.items():
-                    f.write(f"{interface}:\n")
-                    for addr in info['addresses']:
-                        f.write(f"  IP: {addr}\n")
+        # Build the report in memory and write it with a single call
+        buf = []
+        buf.append("=" * 80 + "\n")
+        buf.append(f"SYSTEM MONITORING REPORT - {timestamp}\n")
+        buf.append("=" * 80 + "\n\n")
+
+        # System Information
+        buf.append("SYSTEM INFORMATION:\n")
+        buf.append("-" * 40 + "\n")
+        sys_info = report['system_info']
+        buf.append(f"Hostname: {sys_info['hostname']}\n")
+        buf.append(f"Full Hostname: {sys_info['full_hostname']}\n")
+        buf.append(f"Serial Number: {sys_info['serial_number']}\n")
+        buf.append(f"Distribution: {sys_info['distribution']}\n")
+        buf.append(f"Kernel: {sys_info['kernel']}\n")
+        buf.append(f"Architecture: {sys_info['architecture']}\n")
+        buf.append(f"Current User: {sys_info['current_user']}\n")
+        buf.append(f"Python Version: {sys_info['python_version']}\n")
+        buf.append(f"System Uptime: {sys_info['system_uptime']}\n")
+        buf.append(f"Load Average: {sys_info['load_average']}\n\n")
+
+        # Memory Usage
+        buf.append("MEMORY USAGE:\n")
+        buf.append("-" * 40 + "\n")
+        mem = report['memory_usage']
+        if mem:
+            buf.append(f"Total: {mem['total_gb']:.2f} GB\n")
+            buf.append(f"Used: {mem['used_gb']:.2f} GB\n")
+            buf.append(f"Available: {mem['available_gb']:.2f} GB\n")
+            buf.append(f"Usage: {mem['usage_percent']:.1f}%\n")
+            if mem['usage_percent'] > 85:
+                buf.append("âš ï¸  WARNING: High memory usage!\n")
+        buf.append("\n")
+
+        # Disk Usage
+        buf.append("DISK USAGE:\n")
+        buf.append("-" * 40 + "\n")
+        for path, disk_info in report['disk_usage'].items():
+            buf.append(f"{path}:\n")
+            buf.append(f"  Total: {disk_info['total_gb']} GB\n")
+            buf.append(f"  Used: {disk_info['used_gb']} GB\n")
+            buf.append(f"  Free: {disk_info['free_gb']} GB\n")
+            buf.append(f"  Usage: {disk_info['usage_percent']:.1f}%\n")
+            if disk_info['usage_percent'] > 80:
+                buf.append("  âš ï¸  WARNING: High disk usage!\n")
+            buf.append("\n")
+
+        # Process Status
+        buf.append("PROCESS STATUS:\n")
+        buf.append("-" * 40 + "\n")
+        for process, status in report['process_status'].items():
+            buf.append(f"{process}: ")
+            if status['running']:
+                buf.append(f"Running ({status['count']} instances) - PIDs: {', '.join(status['pids'])}\n")
             else:
-                f.write("No network interface information available\n")
-            f.write("\n")
+                buf.append("Not running\n")
+        buf.append("\n")
+
+        # Service Status
+        buf.append("SERVICE STATUS:\n")
+        buf.append("-" * 40 + "\n")
+        for service, status in report['service_status'].items():
+            buf.append(f"{service}: {status}\n")
+        buf.append("\n")
+
+        # Users
+        buf.append("SYSTEM USERS:\n")
+        buf.append("-" * 40 + "\n")
+        users = report['users']
+        if users:
+            regular_users = [u for u in users if u['uid'] >= 1000 and u['can_login']]
+            system_users = [u for u in users if u['uid'] < 1000]
+            service_users = [u for u in users if u['uid'] >= 1000 and not u['can_login']]
+
+            buf.append(f"Total users: {len(users)}\n")
+            buf.append(f"Regular users: {len(regular_users)}\n")
+            buf.append(f"System users: {len(system_users)}\n")
+            buf.append(f"Service users: {len(service_users)}\n\n")
+
+            if regular_users:
+                buf.append("Regular users with login access:\n")
+                for user in regular_users:
+                    buf.append(f"  {user['username']} (UID: {user['uid']}, Home: {user['home_dir']})\n")
+                    buf.append(f"    Shell: {user['shell']}, Home exists: {user['home_exists']}\n")
+                buf.append("\n")
+
+            if service_users:
+                buf.append("Service users (no login):\n")
+                for user in service_users[:10]:  # Show first 10 service users
+                    buf.append(f"  {user['username']} (UID: {user['uid']}, Shell: {user['shell']})\n")
+                if len(service_users) > 10:
+                    buf.append(f"  ... and {len(service_users) - 10} more service users\n")
+                buf.append("\n")
+        else:
+            buf.append("No user information available\n\n")
+
+        # Security Check
+        buf.append("SECURITY CHECK:\n")
+        buf.append("-" * 40 + "\n")
+        security = report['security_check']
+        buf.append(f"Failed login attempts: {security['failed_logins']}\n")
+
+        if security['permission_issues']:
+            buf.append("âš ï¸  SECURITY WARNINGS:\n")
+            for issue in security['permission_issues']:
+                buf.append(f"  - {issue}\n")
+        else:
+            buf.append("âœ… No permission issues found\n")
+        buf.append("\n")
+
+        # Cleanup Recommendations
+        buf.append("CLEANUP RECOMMENDATIONS:\n")
+        buf.append("-" * 40 + "\n")
+        cleanup = report['cleanup_recommendations']
+        buf.append(f"Old log files: {cleanup['old_logs']}\n")
+        buf.append(f"Old temp files: {cleanup['temp_files']}\n")
+        buf.append(f"Package cache: {cleanup['package_cache']}\n")
+        buf.append("\n")
+
+        # Network Interfaces
+        buf.append("NETWORK INTERFACES:\n")
+        buf.append("-" * 40 + "\n")
+        networks = report['network_interfaces']
+        if networks:
+            for interface, info in networks.items():
+                buf.append(f"{interface}:\n")
+                for addr in info['addresses']:
+                    buf.append(f"  IP: {addr}\n")
+        else:
+            buf.append("No network interface information available\n")
+        buf.append("\n")
 
-            f.write("=" * 80 + "\n")
-            f.write("Report generation completed\n")
-            f.write("=" * 80 + "\n")
+        buf.append("=" * 80 + "\n")
+        buf.append("Report generation completed\n")
+        buf.append("=" * 80 + "\n")
+
+        with open("report_monitoring.txt", "w", buffering=1024 * 1024) as f:
+            f.write(''.join(buf))
 
         self.log_message("Monitoring report saved to: report_monitoring.txt")
 
+  @_flushes_log
   def run_command(self, command, timeout=30):
     """Execute shell command with timeout"""
     self.log_message(f"=== Executing command: {command} ===")
@@ -726,6 +1037,47 @@ class LinuxAutomation:
       self.log_message(f"Error executing command: {e}")
       return None
 
+  @_flushes_log
+  async def run_command_async(self, command, timeout=30):
+    """Execute shell command with timeout without blocking the event loop"""
+    self.log_message(f"=== Executing command: {command} ===")
+
+    try:
+      proc = await asyncio.create_subprocess_shell(
+          command,
+          stdout=asyncio.subprocess.PIPE,
+          stderr=asyncio.subprocess.PIPE)
+      try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+      except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        self.log_message(f"Command timed out after {timeout} seconds")
+        return None
+
+      stdout = stdout.decode(errors='replace')
+      stderr = stderr.decode(errors='replace')
+      if proc.returncode == 0:
+        self.log_message(f"Command output:\n{stdout}")
+        return stdout
+      else:
+        self.log_message(
+            f"Command failed (exit code {proc.returncode}):\n{stderr}")
+        return None
+
+    except Exception as e:
+      self.log_message(f"Error executing command: {e}")
+      return None
+
+  def run_commands(self, commands, timeout=30):
+    """Execute several shell commands concurrently, returning their outputs"""
+
+    async def gather():
+      return await asyncio.gather(
+          *(self.run_command_async(command, timeout) for command in commands))
+
+    return asyncio.run(gather())
+
 
 def main():
   """Main automation function"""